@@ -4,222 +4,339 @@ Provides user review, editing, and approval capabilities.
 """
 
 import asyncio
+import hashlib
+import itertools
+import json
 import logging
+import re
+from dataclasses import dataclass
+from datetime import date
 from typing import List, Dict, Any, Optional, Tuple
 from enum import Enum
 
-from rich.console import Console
+from rich.console import Group
+from rich.live import Live
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 from rich.columns import Columns
-from rich.markdown import Markdown
 
+from config import _PRIORITY_MAP
 from notion_api import Task, Job
-from page_generator import PageGenerator
 from utils import (
+    console,
     clean_job_title,
     format_deadline_urgency,
     create_priority_badge,
     truncate_text
 )
 
-console = Console()
 logger = logging.getLogger("task_continuity")
 
 class EditAction(Enum):
     """Available edit actions."""
     VIEW_PREVIEW = "preview"
-    EDIT_TASKS = "tasks"  
+    EDIT_TASKS = "tasks"
     EDIT_JOBS = "jobs"
     ADD_TASK = "add"
     REMOVE_TASK = "remove"
     APPROVE = "approve"
     CANCEL = "cancel"
 
+# Menu rendered once per review session - built a single time at import
+_ACTIONS = (
+    ("preview", "📋 View full preview"),
+    ("tasks", "✏️  Edit tasks"),
+    ("jobs", "💼 Edit feature jobs"),
+    ("add", "➕ Add new task"),
+    ("remove", "➖ Remove task"),
+    ("approve", "✅ Approve & publish"),
+    ("cancel", "❌ Cancel")
+)
+_ACTION_CHOICES = [key for key, _ in _ACTIONS]
+_ACTION_MENU = Text("\n".join(f"   {key:8} - {description}" for key, description in _ACTIONS))
+
+# Shared prompt choices - allocated once instead of per prompt
+_AVAILABLE_CATEGORIES = (
+    "Priorities", "Daily Habits", "Application Focus",
+    "Research & Learning", "Networking", "Pipeline Development"
+)
+_PRIORITY_CHOICES = ("High", "Medium", "Low", "None")
+
+# Selection parser - one C-level pass accepts "1,3,5", "1 3 5", "1;3", ...
+_NUM_RE = re.compile(r"\d+")
+
+# Static headers - styled once at import instead of per print
+_FINAL_REVIEW_HEADER = Text("🔍 Final Review", style="bold yellow")
+
+@dataclass(slots=True)
+class ReviewState:
+    """Working copy of the plan during an interactive review session.
+
+    Slotted attribute access is cheaper than dict-key lookups in the
+    editing loops, and snapshotting here (including the category lists)
+    keeps edits from aliasing the original page content.
+    """
+    date: date
+    formatted_date: str
+    carryover_tasks: List[Task]
+    feature_jobs: List[Job]
+    task_categories: Dict[str, List[Task]]
+    name_lower: Optional[List[str]] = None
+
+    @classmethod
+    def from_page_content(
+        cls,
+        page_content: Dict[str, Any],
+        carryover_tasks: List[Task],
+        feature_jobs: List[Job]
+    ) -> 'ReviewState':
+        """Snapshot the draft content into an independent working state."""
+        return cls(
+            date=page_content['date'],
+            formatted_date=page_content['formatted_date'],
+            carryover_tasks=list(carryover_tasks),
+            feature_jobs=list(feature_jobs),
+            task_categories={
+                category: list(tasks)
+                for category, tasks in page_content['task_categories'].items()
+            }
+        )
+
+    def to_page_content(self, base: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge the working state back into a page_content dict."""
+        merged = {
+            **base,
+            'date': self.date,
+            'formatted_date': self.formatted_date,
+            'carryover_tasks': self.carryover_tasks,
+            'feature_jobs': self.feature_jobs,
+            'task_categories': self.task_categories
+        }
+        # Pre-rendered category strings reflect the original content -
+        # drop them so consumers re-render from the edited grouping
+        merged.pop('rendered_categories', None)
+        return merged
+
 class CLIInterface:
     """Interactive command-line interface for user review and editing."""
-    
+
     def __init__(self):
+        # Deferred import - PageGenerator (and its template load) is only
+        # needed once an interface is actually constructed
+        from page_generator import PageGenerator
+
         self.logger = logging.getLogger("task_continuity.cli")
-    
+        # Reused for preview rendering only - no Notion client/config needed
+        self._preview_generator = PageGenerator(None, None)
+        # Rendered previews keyed by content hash, so unchanged content
+        # skips both string building and Markdown parsing
+        self._preview_cache: Dict[str, Any] = {}
+        self._base_content: Dict[str, Any] = {}
+        self._job_keys: List[Tuple[int, date]] = []
+        # Editing actions dispatch through a table - one dict lookup per
+        # choice instead of a chain of Enum equality checks. APPROVE and
+        # CANCEL stay in the loop since they end the session.
+        self._handlers = {
+            EditAction.VIEW_PREVIEW: self._display_full_preview,
+            EditAction.EDIT_TASKS: self._edit_tasks_interactive,
+            EditAction.EDIT_JOBS: self._edit_jobs_interactive,
+            EditAction.ADD_TASK: self._add_task_interactive,
+            EditAction.REMOVE_TASK: self._remove_task_interactive,
+        }
+
+    @staticmethod
+    def _preview_cache_key(state: ReviewState) -> str:
+        """Build a stable hash of the content that affects the preview."""
+
+        payload = json.dumps({
+            'date': state.formatted_date,
+            'tasks': [
+                (t.id, t.name, t.category, t.priority_level)
+                for t in state.carryover_tasks
+            ],
+            'jobs': [(j.id, j.name) for j in state.feature_jobs]
+        }, sort_keys=True)
+
+        return hashlib.blake2b(payload.encode()).hexdigest()
+
+    async def _ask(self, *args, **kwargs) -> str:
+        """Prompt without blocking the event loop.
+
+        Prompt.ask blocks for as long as the user is thinking, which would
+        starve any concurrent Notion I/O - run it in a worker thread.
+        """
+        return await asyncio.to_thread(Prompt.ask, *args, **kwargs)
+
+    async def _confirm(self, *args, **kwargs) -> bool:
+        """Confirm.ask counterpart of _ask - runs off the event loop."""
+        return await asyncio.to_thread(Confirm.ask, *args, **kwargs)
+
     async def review_and_edit(
-        self, 
+        self,
         page_content: Dict[str, Any],
         carryover_tasks: List[Task],
         feature_jobs: List[Job]
     ) -> Dict[str, Any]:
         """Main review and editing flow."""
-        
+
         self.logger.info("Starting interactive review session")
-        
-        # Make working copies
-        working_content = page_content.copy()
-        working_content['carryover_tasks'] = carryover_tasks.copy()
-        working_content['feature_jobs'] = feature_jobs.copy()
-        
+
+        # Scope the pure string-helper caches to this session so long-lived
+        # processes don't accumulate stale entries (deadline urgency is
+        # relative to today)
+        for helper in (clean_job_title, truncate_text, format_deadline_urgency):
+            helper.cache_clear()
+
+        # Snapshot working state; the original dict is only needed again
+        # at the boundary when approving
+        self._base_content = page_content
+        state = ReviewState.from_page_content(page_content, carryover_tasks, feature_jobs)
+
+        # Decorate once: reorders sort index tuples, not Job objects, so
+        # the priority parse runs once per job rather than per comparison
+        self._job_keys = self._build_job_keys(state.feature_jobs)
+
         # Show initial preview
-        await self._display_draft_preview(working_content)
-        
+        await self._display_draft_preview(state)
+
+        # Print the menu once - _get_user_action only re-prompts
+        console.print("🎛️  What would you like to do?", style="bold")
+        console.print(_ACTION_MENU)
+
         # Interactive editing loop
         while True:
             action = await self._get_user_action()
-            
-            if action == EditAction.VIEW_PREVIEW:
-                await self._display_full_preview(working_content)
-                
-            elif action == EditAction.EDIT_TASKS:
-                working_content = await self._edit_tasks_interactive(working_content)
-                
-            elif action == EditAction.EDIT_JOBS:
-                working_content = await self._edit_jobs_interactive(working_content)
-                
-            elif action == EditAction.ADD_TASK:
-                working_content = await self._add_task_interactive(working_content)
-                
-            elif action == EditAction.REMOVE_TASK:
-                working_content = await self._remove_task_interactive(working_content)
-                
+
+            handler = self._handlers.get(action)
+            if handler is not None:
+                # Display handlers return None; editors return the state
+                state = (await handler(state)) or state
+
             elif action == EditAction.APPROVE:
-                if await self._confirm_approval(working_content):
+                if await self._confirm_approval(state):
                     console.print("✅ Plan approved for publication", style="bold green")
-                    return working_content
-                    
+                    return state.to_page_content(page_content)
+
             elif action == EditAction.CANCEL:
-                if Confirm.ask("⚠️  Are you sure you want to cancel? Changes will be lost."):
+                if await self._confirm("⚠️  Are you sure you want to cancel? Changes will be lost."):
                     console.print("❌ Operation cancelled", style="yellow")
                     raise KeyboardInterrupt()
-    
-    async def _display_draft_preview(self, page_content: Dict[str, Any]):
+
+    async def _display_draft_preview(self, state: ReviewState):
         """Display initial draft preview."""
-        
+
         title_text = Text(f"📋 Tomorrow's Plan Draft", style="bold blue")
-        subtitle_text = Text(f"Date: {page_content['formatted_date']}", style="dim")
-        
-        console.print(Panel(
-            f"{title_text}\n{subtitle_text}",
-            title="Draft Preview",
-            padding=(1, 2)
-        ))
-        
+        subtitle_text = Text(f"Date: {state.formatted_date}", style="dim")
+
         # Quick stats
         stats_table = Table(show_header=False, box=None)
         stats_table.add_column("Metric", style="cyan")
         stats_table.add_column("Count", style="yellow")
-        
-        stats_table.add_row("📋 Carryover Tasks", str(len(page_content['carryover_tasks'])))
-        stats_table.add_row("💼 Feature Jobs", str(len(page_content['feature_jobs'])))
-        stats_table.add_row("📂 Categories", str(len(page_content['task_categories'])))
-        
-        console.print(stats_table)
-        console.print()
-        
-        # Show sample tasks and jobs
-        await self._show_quick_summary(page_content)
-    
-    async def _show_quick_summary(self, page_content: Dict[str, Any]):
-        """Show quick summary of key content."""
-        
+
+        stats_table.add_row("📋 Carryover Tasks", str(len(state.carryover_tasks)))
+        stats_table.add_row("💼 Feature Jobs", str(len(state.feature_jobs)))
+        stats_table.add_row("📂 Categories", str(len(state.task_categories)))
+
+        # One print for the whole draft preview - a single Rich layout
+        # pass instead of four separate console writes
+        console.print(Group(
+            Panel(
+                f"{title_text}\n{subtitle_text}",
+                title="Draft Preview",
+                padding=(1, 2)
+            ),
+            stats_table,
+            Text(""),
+            self._build_quick_summary(state),
+            Text("")
+        ))
+
+    def _build_quick_summary(self, state: ReviewState) -> Columns:
+        """Build the quick summary panels for key content."""
+
         panels = []
-        
-        # Priority tasks sample
-        priority_tasks = [t for t in page_content['carryover_tasks'] if t.category == "Priorities"]
+
+        # Priority tasks sample - reuse the maintained grouping instead of
+        # re-scanning the full task list on every repaint
+        priority_tasks = state.task_categories.get("Priorities", [])
         if priority_tasks:
             priority_text = "\n".join([f"• {truncate_text(task.name, 40)}" for task in priority_tasks[:3]])
             if len(priority_tasks) > 3:
                 priority_text += f"\n... and {len(priority_tasks) - 3} more"
         else:
             priority_text = "No priority tasks"
-        
+
         panels.append(Panel(
             priority_text,
             title=f"🎯 Priorities ({len(priority_tasks)})",
             width=40
         ))
-        
-        # Feature jobs sample  
-        if page_content['feature_jobs']:
+
+        # Feature jobs sample
+        if state.feature_jobs:
             jobs_text = "\n".join([
                 f"• {truncate_text(clean_job_title(job.name), 35)}"
-                for job in page_content['feature_jobs'][:3]
+                for job in state.feature_jobs[:3]
             ])
-            if len(page_content['feature_jobs']) > 3:
-                jobs_text += f"\n... and {len(page_content['feature_jobs']) - 3} more"
+            if len(state.feature_jobs) > 3:
+                jobs_text += f"\n... and {len(state.feature_jobs) - 3} more"
         else:
             jobs_text = "No feature jobs"
-            
+
         panels.append(Panel(
             jobs_text,
-            title=f"💼 Feature Jobs ({len(page_content['feature_jobs'])})",
+            title=f"💼 Feature Jobs ({len(state.feature_jobs)})",
             width=40
         ))
-        
-        console.print(Columns(panels, equal=True))
-        console.print()
-    
+
+        return Columns(panels, equal=True)
+
     async def _get_user_action(self) -> EditAction:
         """Get user's desired action."""
-        
-        actions = [
-            ("preview", "📋 View full preview"),
-            ("tasks", "✏️  Edit tasks"),
-            ("jobs", "💼 Edit feature jobs"), 
-            ("add", "➕ Add new task"),
-            ("remove", "➖ Remove task"),
-            ("approve", "✅ Approve & publish"),
-            ("cancel", "❌ Cancel")
-        ]
-        
-        console.print("🎛️  What would you like to do?", style="bold")
-        for key, description in actions:
-            console.print(f"   {key:8} - {description}")
-        
+
         while True:
-            choice = Prompt.ask("\nYour choice", choices=[a[0] for a in actions])
+            choice = await self._ask("\nYour choice", choices=_ACTION_CHOICES)
             try:
                 return EditAction(choice)
             except ValueError:
                 console.print("❌ Invalid choice, please try again", style="red")
-    
-    async def _display_full_preview(self, page_content: Dict[str, Any]):
+
+    async def _display_full_preview(self, state: ReviewState):
         """Display full page preview."""
-        
-        generator = PageGenerator(None, None)  # Just for preview generation
-        preview_text = generator.preview_page_content(page_content)
-        
+
+        # Markdown pulls in Pygments - import it only when a full preview
+        # is actually requested
+        from rich.markdown import Markdown
+
+        cache_key = self._preview_cache_key(state)
+        markdown = self._preview_cache.get(cache_key)
+
+        if markdown is None:
+            preview_text = self._preview_generator.preview_page_content(
+                state.to_page_content(self._base_content)
+            )
+            markdown = Markdown(preview_text)
+            self._preview_cache[cache_key] = markdown
+
         console.print(Panel(
-            Markdown(preview_text),
-            title=f"Full Preview - {page_content['formatted_date']}",
+            markdown,
+            title=f"Full Preview - {state.formatted_date}",
             padding=(1, 2)
         ))
-        
-        input("\nPress Enter to continue...")
-    
-    async def _edit_tasks_interactive(self, page_content: Dict[str, Any]) -> Dict[str, Any]:
-        """Interactive task editing."""
-        
-        console.print("📝 Task Editor", style="bold blue")
-        
-        # Show tasks by category
-        categories = page_content['task_categories']
-        
-        if not categories:
-            console.print("No tasks to edit", style="yellow")
-            return page_content
-        
-        # Display current tasks
+
+        await asyncio.to_thread(input, "\nPress Enter to continue...")
+
+    def _build_tasks_table(self, all_tasks: List[Task]) -> Table:
+        """Build the numbered task table shown in the task editor."""
+
         table = Table(title="Current Tasks")
         table.add_column("#", style="dim")
         table.add_column("Category", style="cyan")
         table.add_column("Task", style="white")
         table.add_column("Priority", style="yellow")
-        
-        all_tasks = []
-        for category, tasks in categories.items():
-            all_tasks.extend(tasks)
-        
+
         for i, task in enumerate(all_tasks, 1):
             table.add_row(
                 str(i),
@@ -227,276 +344,390 @@ class CLIInterface:
                 truncate_text(task.name, 50),
                 task.priority_level or "None"
             )
-        
-        console.print(table)
-        
+
+        return table
+
+    def _build_jobs_table(self, jobs: List[Job]) -> Table:
+        """Build the numbered job table shown in the jobs editor."""
+
+        table = Table(title="Current Feature Jobs")
+        table.add_column("#", style="dim")
+        table.add_column("Job Title", style="cyan")
+        table.add_column("Priority", style="yellow")
+        table.add_column("Deadline", style="green")
+
+        for i, job in enumerate(jobs, 1):
+            deadline_str = format_deadline_urgency(job.deadline) if job.deadline else "No deadline"
+            priority_str = create_priority_badge(job.priority) if job.priority else "None"
+
+            table.add_row(
+                str(i),
+                clean_job_title(job.name)[:40],
+                priority_str,
+                deadline_str
+            )
+
+        return table
+
+    @staticmethod
+    def _build_job_keys(jobs: List[Job]) -> List[Tuple[int, date]]:
+        """Precompute (priority score, deadline) sort keys for the jobs."""
+        return [
+            (_PRIORITY_MAP.get(job.priority, 4), job.deadline or date.max)
+            for job in jobs
+        ]
+
+    async def _edit_tasks_interactive(self, state: ReviewState) -> ReviewState:
+        """Interactive task editing."""
+
+        console.print("📝 Task Editor", style="bold blue")
+
+        # Show tasks by category
+        categories = state.task_categories
+
+        if not categories:
+            console.print("No tasks to edit", style="yellow")
+            return state
+
+        all_tasks = list(itertools.chain.from_iterable(categories.values()))
+
         # Edit options
         console.print("\n🛠️  Edit Options:")
         console.print("   • Enter task numbers to toggle (e.g., '1,3,5')")
         console.print("   • Type 'done' to finish editing")
         console.print("   • Type 'cancel' to cancel changes")
-        
+
+        # Live holds the table in place - repaints happen only on real
+        # edits via live.update, not after every prompt round-trip
+        with Live(
+            self._build_tasks_table(all_tasks),
+            console=console,
+            refresh_per_second=8,
+            auto_refresh=False
+        ) as live:
+            await self._edit_tasks_loop(state, all_tasks, live)
+
+        return state
+
+    async def _edit_tasks_loop(self, state: ReviewState, all_tasks: List[Task], live: Live):
+        """Prompt loop for the task editor - runs inside the Live table."""
+
         while True:
-            choice = Prompt.ask("\nYour choice").strip().lower()
-            
+            choice = (await self._ask("\nYour choice")).strip().lower()
+
             if choice == 'done':
                 break
             elif choice == 'cancel':
-                return page_content
-            
+                return
+
             # Parse task numbers
             try:
-                if ',' in choice:
-                    task_numbers = [int(x.strip()) for x in choice.split(',')]
-                else:
-                    task_numbers = [int(choice)]
-                
+                task_numbers = [int(m) for m in _NUM_RE.findall(choice)]
+                if not task_numbers:
+                    raise ValueError("no task numbers given")
+
                 # Validate range
                 for num in task_numbers:
                     if not (1 <= num <= len(all_tasks)):
                         raise ValueError(f"Task {num} out of range")
-                
+
                 # Show selected tasks for confirmation
                 selected_tasks = [all_tasks[i-1] for i in task_numbers]
                 console.print("\n📋 Selected tasks:")
                 for task in selected_tasks:
                     console.print(f"   • {task.name} ({task.category})")
-                
-                action = Prompt.ask(
-                    "\nAction for selected tasks", 
+
+                action = await self._ask(
+                    "\nAction for selected tasks",
                     choices=["remove", "change-priority", "change-category", "back"]
                 )
-                
+
                 if action == "remove":
-                    if Confirm.ask("Remove these tasks?"):
-                        for task in selected_tasks:
-                            page_content['carryover_tasks'].remove(task)
-                        page_content = self._rebuild_page_content(page_content)
+                    if await self._confirm("Remove these tasks?"):
+                        # Single linear pass filtered by identity - avoids
+                        # O(k*n) repeated list.remove and dataclass __eq__
+                        removed_ids = {id(t) for t in selected_tasks}
+                        state.carryover_tasks = [
+                            t for t in state.carryover_tasks
+                            if id(t) not in removed_ids
+                        ]
+                        self._apply_task_delta(state, removed=selected_tasks)
                         console.print("✅ Tasks removed", style="green")
                         break
-                        
+
                 elif action == "change-priority":
-                    new_priority = Prompt.ask(
+                    new_priority = await self._ask(
                         "New priority",
-                        choices=["High", "Medium", "Low", "None"],
+                        choices=_PRIORITY_CHOICES,
                         default="None"
                     )
                     for task in selected_tasks:
                         task.priority_level = new_priority if new_priority != "None" else ""
-                    page_content = self._rebuild_page_content(page_content)
+                    # Categories are untouched - just invalidate the preview
+                    self._apply_task_delta(state)
                     console.print("✅ Priority updated", style="green")
-                    
+                    live.update(self._build_tasks_table(all_tasks), refresh=True)
+
                 elif action == "change-category":
-                    available_categories = [
-                        "Priorities", "Daily Habits", "Application Focus",
-                        "Research & Learning", "Networking", "Pipeline Development"
-                    ]
-                    new_category = Prompt.ask(
+                    new_category = await self._ask(
                         "New category",
-                        choices=available_categories
+                        choices=_AVAILABLE_CATEGORIES
                     )
+                    moves = [(task, task.category) for task in selected_tasks]
                     for task in selected_tasks:
                         task.category = new_category
-                    page_content = self._rebuild_page_content(page_content)
+                    self._apply_task_delta(state, moved=moves)
                     console.print("✅ Category updated", style="green")
-                
+                    live.update(self._build_tasks_table(all_tasks), refresh=True)
+
             except ValueError as e:
                 console.print(f"❌ Invalid input: {e}", style="red")
                 continue
-        
-        return page_content
-    
-    async def _edit_jobs_interactive(self, page_content: Dict[str, Any]) -> Dict[str, Any]:
+
+    async def _edit_jobs_interactive(self, state: ReviewState) -> ReviewState:
         """Interactive job editing."""
-        
+
         console.print("💼 Feature Jobs Editor", style="bold blue")
-        
-        jobs = page_content['feature_jobs']
-        
+
+        jobs = state.feature_jobs
+
         if not jobs:
             console.print("No feature jobs to edit", style="yellow")
-            return page_content
-        
-        # Display current jobs
-        table = Table(title="Current Feature Jobs")
-        table.add_column("#", style="dim")
-        table.add_column("Job Title", style="cyan")
-        table.add_column("Priority", style="yellow")
-        table.add_column("Deadline", style="green")
-        
-        for i, job in enumerate(jobs, 1):
-            deadline_str = format_deadline_urgency(job.deadline) if job.deadline else "No deadline"
-            priority_str = create_priority_badge(job.priority) if job.priority else "None"
-            
-            table.add_row(
-                str(i),
-                clean_job_title(job.name)[:40],
-                priority_str,
-                deadline_str
-            )
-        
-        console.print(table)
-        
+            return state
+
         console.print("\n🛠️  Edit Options:")
         console.print("   • Enter job numbers to remove (e.g., '1,3')")
         console.print("   • Type 'reorder' to change job order")
         console.print("   • Type 'done' to finish editing")
-        
+
+        # Same Live pattern as the task editor - the table stays pinned
+        # and is only repainted when the job list actually changes
+        with Live(
+            self._build_jobs_table(jobs),
+            console=console,
+            refresh_per_second=8,
+            auto_refresh=False
+        ) as live:
+            await self._edit_jobs_loop(state, jobs, live)
+
+        return state
+
+    async def _edit_jobs_loop(self, state: ReviewState, jobs: List[Job], live: Live):
+        """Prompt loop for the jobs editor - runs inside the Live table."""
+
         while True:
-            choice = Prompt.ask("\nYour choice").strip().lower()
-            
+            choice = (await self._ask("\nYour choice")).strip().lower()
+
             if choice == 'done':
                 break
             elif choice == 'reorder':
-                # Simple reordering by priority
-                if Confirm.ask("Reorder jobs by priority and deadline?"):
-                    # Re-sort jobs (this would need the original sorting logic)
+                if await self._confirm("Reorder jobs by priority and deadline?"):
+                    keys = self._job_keys
+                    if len(keys) != len(jobs):
+                        # Jobs changed since the keys were decorated
+                        keys = self._job_keys = self._build_job_keys(jobs)
+                    order = sorted(range(len(jobs)), key=keys.__getitem__)
+                    jobs[:] = [jobs[i] for i in order]
+                    keys[:] = [keys[i] for i in order]
+                    self._preview_cache.clear()
+                    live.update(self._build_jobs_table(jobs), refresh=True)
                     console.print("✅ Jobs reordered", style="green")
             else:
                 try:
                     # Parse job numbers to remove
-                    if ',' in choice:
-                        job_numbers = [int(x.strip()) for x in choice.split(',')]
-                    else:
-                        job_numbers = [int(choice)]
-                    
+                    job_numbers = [int(m) for m in _NUM_RE.findall(choice)]
+                    if not job_numbers:
+                        raise ValueError("no job numbers given")
+
                     # Validate range
                     for num in job_numbers:
                         if not (1 <= num <= len(jobs)):
                             raise ValueError(f"Job {num} out of range")
-                    
+
                     # Show selected jobs
                     selected_jobs = [jobs[i-1] for i in job_numbers]
                     console.print("\n📋 Selected jobs:")
                     for job in selected_jobs:
                         console.print(f"   • {clean_job_title(job.name)}")
-                    
-                    if Confirm.ask("Remove these jobs?"):
-                        for job in selected_jobs:
-                            page_content['feature_jobs'].remove(job)
+
+                    if await self._confirm("Remove these jobs?"):
+                        removed_ids = {id(j) for j in selected_jobs}
+                        state.feature_jobs = [
+                            j for j in state.feature_jobs
+                            if id(j) not in removed_ids
+                        ]
+                        self._preview_cache.clear()
                         console.print("✅ Jobs removed", style="green")
                         break
-                        
+
                 except ValueError as e:
                     console.print(f"❌ Invalid input: {e}", style="red")
                     continue
-        
-        return page_content
-    
-    async def _add_task_interactive(self, page_content: Dict[str, Any]) -> Dict[str, Any]:
+
+    async def _add_task_interactive(self, state: ReviewState) -> ReviewState:
         """Add new task interactively."""
-        
+
         console.print("➕ Add New Task", style="bold blue")
-        
+
         # Get task details
-        task_name = Prompt.ask("Task name")
+        task_name = await self._ask("Task name")
         if not task_name.strip():
             console.print("❌ Task name cannot be empty", style="red")
-            return page_content
-        
-        categories = [
-            "Priorities", "Daily Habits", "Application Focus",
-            "Research & Learning", "Networking", "Pipeline Development"
-        ]
-        category = Prompt.ask("Category", choices=categories, default="Application Focus")
-        
-        priority = Prompt.ask(
-            "Priority", 
-            choices=["High", "Medium", "Low", "None"],
+            return state
+
+        category = await self._ask("Category", choices=_AVAILABLE_CATEGORIES, default="Application Focus")
+
+        priority = await self._ask(
+            "Priority",
+            choices=_PRIORITY_CHOICES,
             default="Medium"
         )
-        
+
         # Create new task
         new_task = Task(
             id="",
             name=task_name.strip(),
             status=False,
-            next_reminder=page_content['date'],
+            next_reminder=state.date,
             priority_level=priority if priority != "None" else "",
             category=category
         )
-        
-        page_content['carryover_tasks'].append(new_task)
-        page_content = self._rebuild_page_content(page_content)
-        
+
+        state.carryover_tasks.append(new_task)
+        self._apply_task_delta(state, added=[new_task])
+
         console.print(f"✅ Added task: {task_name}", style="green")
-        return page_content
-    
-    async def _remove_task_interactive(self, page_content: Dict[str, Any]) -> Dict[str, Any]:
+        return state
+
+    async def _remove_task_interactive(self, state: ReviewState) -> ReviewState:
         """Remove task interactively."""
-        
+
         console.print("➖ Remove Task", style="bold blue")
-        
-        tasks = page_content['carryover_tasks']
+
+        tasks = state.carryover_tasks
         if not tasks:
             console.print("No tasks to remove", style="yellow")
-            return page_content
-        
+            return state
+
         # Simple search interface
-        search_term = Prompt.ask("Search for task (partial name)").strip().lower()
-        
+        search_term = (await self._ask("Search for task (partial name)")).strip().lower()
+
+        # Lowercased names are cached on the state so repeated searches
+        # don't re-lowercase every task; edits invalidate the index
+        lowers = state.name_lower
+        if lowers is None or len(lowers) != len(tasks):
+            lowers = state.name_lower = [t.name.lower() for t in tasks]
+
         matching_tasks = [
-            task for task in tasks 
-            if search_term in task.name.lower()
+            tasks[i] for i, name_lower in enumerate(lowers)
+            if search_term in name_lower
         ]
-        
+
         if not matching_tasks:
             console.print("❌ No matching tasks found", style="red")
-            return page_content
-        
+            return state
+
         if len(matching_tasks) == 1:
             task_to_remove = matching_tasks[0]
-            if Confirm.ask(f"Remove task: {task_to_remove.name}?"):
-                page_content['carryover_tasks'].remove(task_to_remove)
-                page_content = self._rebuild_page_content(page_content)
+            if await self._confirm(f"Remove task: {task_to_remove.name}?"):
+                state.carryover_tasks = [
+                    t for t in state.carryover_tasks
+                    if t is not task_to_remove
+                ]
+                self._apply_task_delta(state, removed=[task_to_remove])
                 console.print("✅ Task removed", style="green")
         else:
             console.print(f"Found {len(matching_tasks)} matching tasks:")
             for i, task in enumerate(matching_tasks, 1):
                 console.print(f"   {i}. {task.name} ({task.category})")
-            
-            choice = Prompt.ask(
+
+            choice = await self._ask(
                 "Which task to remove?",
                 choices=[str(i) for i in range(1, len(matching_tasks) + 1)]
             )
-            
+
             task_to_remove = matching_tasks[int(choice) - 1]
-            if Confirm.ask(f"Remove task: {task_to_remove.name}?"):
-                page_content['carryover_tasks'].remove(task_to_remove)
-                page_content = self._rebuild_page_content(page_content)
+            if await self._confirm(f"Remove task: {task_to_remove.name}?"):
+                state.carryover_tasks = [
+                    t for t in state.carryover_tasks
+                    if t is not task_to_remove
+                ]
+                self._apply_task_delta(state, removed=[task_to_remove])
                 console.print("✅ Task removed", style="green")
-        
-        return page_content
-    
-    def _rebuild_page_content(self, page_content: Dict[str, Any]) -> Dict[str, Any]:
-        """Rebuild page content after task modifications."""
-        
+
+        return state
+
+    def _apply_task_delta(
+        self,
+        state: ReviewState,
+        removed: Optional[List[Task]] = None,
+        added: Optional[List[Task]] = None,
+        moved: Optional[List[Tuple[Task, str]]] = None
+    ) -> ReviewState:
+        """Apply a task edit to the category grouping incrementally.
+
+        Only the categories touched by the edit are updated, instead of
+        regrouping the whole task list after every interactive action.
+        `_rebuild_page_content` remains as the full-rebuild fallback.
+        """
+
+        self._preview_cache.clear()
+        state.name_lower = None
+        categories = state.task_categories
+
+        def _drop(task: Task, category: str):
+            bucket = categories.get(category)
+            if bucket:
+                bucket = [t for t in bucket if t is not task]
+                if bucket:
+                    categories[category] = bucket
+                else:
+                    del categories[category]
+
+        for task in removed or ():
+            _drop(task, task.category)
+
+        for task, old_category in moved or ():
+            _drop(task, old_category)
+            categories.setdefault(task.category, []).append(task)
+
+        for task in added or ():
+            categories.setdefault(task.category, []).append(task)
+
+        return state
+
+    def _rebuild_page_content(self, state: ReviewState) -> ReviewState:
+        """Rebuild the category grouping after task modifications."""
+
         from utils import categorize_tasks_by_category
-        
+
+        # Content changed - cached previews and the search index are stale
+        self._preview_cache.clear()
+        state.name_lower = None
+
         # Rebuild task categories
-        page_content['task_categories'] = categorize_tasks_by_category(
-            page_content['carryover_tasks']
-        )
-        
-        return page_content
-    
-    async def _confirm_approval(self, page_content: Dict[str, Any]) -> bool:
+        state.task_categories = categorize_tasks_by_category(state.carryover_tasks)
+
+        return state
+
+    async def _confirm_approval(self, state: ReviewState) -> bool:
         """Final confirmation before approval."""
-        
-        console.print("🔍 Final Review", style="bold yellow")
-        
-        # Show final stats
-        stats_text = f"""
-📊 Final Plan Summary:
-   • {len(page_content['carryover_tasks'])} tasks to carry over
-   • {len(page_content['feature_jobs'])} feature jobs selected
-   • {len(page_content['task_categories'])} active categories
-   • Target date: {page_content['formatted_date']}
-        """
-        
+
+        console.print(_FINAL_REVIEW_HEADER)
+
+        # Show final stats - Text.assemble keeps the static fragments
+        # pre-styled instead of re-tokenizing markup on every approval
+        stats_text = Text.assemble(
+            ("\n📊 Final Plan Summary:\n", "bold"),
+            f"   • {len(state.carryover_tasks)} tasks to carry over\n",
+            f"   • {len(state.feature_jobs)} feature jobs selected\n",
+            f"   • {len(state.task_categories)} active categories\n",
+            f"   • Target date: {state.formatted_date}\n"
+        )
+
         console.print(Panel(stats_text, title="Summary"))
-        
-        return Confirm.ask(
+
+        return await self._confirm(
             "\n✅ Create tomorrow's plan with these settings?",
             default=True
-        )
\ No newline at end of file
+        )
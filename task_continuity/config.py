@@ -3,19 +3,29 @@ Configuration management for AI Task Continuity System
 Handles environment variables, database IDs, and system settings.
 """
 
+import functools
 import os
+import re
 from pathlib import Path
-from typing import List, Optional
-from dotenv import load_dotenv
-from pydantic import validator
-from pydantic_settings import BaseSettings
-from rich.console import Console
+from typing import Final, List, Optional
+from pydantic import field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
-console = Console()
+from utils import console
+
+# Priority level -> numeric score (lower = higher priority)
+_PRIORITY_MAP: Final[dict] = {
+    "High Prior": 1,
+    "Mid Prior": 2,
+    "Low Prior": 3,
+    "": 4  # No priority set
+}
 
 class Config(BaseSettings):
     """Configuration settings loaded from environment variables."""
-    
+
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False)
+
     # Notion API Configuration
     notion_api_key: str
     plan_ai_database_id: str = "2656a6667ea28002b856c2fbf3f16a80"
@@ -38,73 +48,98 @@ class Config(BaseSettings):
     log_level: str = "INFO"
     log_file: Optional[str] = None
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
-        
-    @validator('notion_api_key')
+    @field_validator('notion_api_key')
+    @classmethod
     def validate_notion_key(cls, v):
         if not v or not v.startswith('secret_'):
             raise ValueError('notion_api_key must be provided and start with "secret_"')
         return v
-        
-    @validator('plan_ai_database_id', 'job_tracker_database_id', 'daily_planner_parent_id')
+
+    @field_validator('plan_ai_database_id', 'job_tracker_database_id', 'daily_planner_parent_id')
+    @classmethod
     def validate_notion_ids(cls, v):
         if not v or len(v) != 32:
             raise ValueError('Notion IDs must be 32 characters long')
         return v
-    
+
     def __init__(self, **kwargs):
-        # Load environment variables
-        env_file = Path('.env')
-        if env_file.exists():
-            load_dotenv(env_file)
-            console.print(f"✓ Loaded environment from {env_file}", style="dim green")
-        else:
-            console.print("⚠️  No .env file found, using environment variables", style="yellow")
-            
+        # .env loading is handled by model_config's env_file
         super().__init__(**kwargs)
-    
+
+        # Precompile one case-insensitive pattern per keyword tier so job
+        # categorization is a single C-level regex scan instead of
+        # per-keyword substring passes with repeated lowercasing. Tiers
+        # emptied via env override are skipped - joining zero keywords
+        # would compile the empty pattern, which matches every title
+        self._tier_patterns = [
+            (score, re.compile('|'.join(re.escape(k) for k in keywords), re.IGNORECASE))
+            for score, keywords in (
+                (1, self.job_keywords_research),
+                (2, self.job_keywords_ai_ml),
+                (3, self.job_keywords_internship),
+                (4, self.job_keywords_engineer),
+            )
+            if keywords
+        ]
+
+        # Keyword lists are static after load; concatenate them once
+        self._all_job_keywords = (
+            self.job_keywords_research +
+            self.job_keywords_ai_ml +
+            self.job_keywords_internship +
+            self.job_keywords_engineer
+        )
+
+        # Union of every tier, for "does any keyword match" checks;
+        # None when no keywords are configured so nothing matches
+        self._keyword_pattern = re.compile(
+            '|'.join(re.escape(k) for k in self._all_job_keywords), re.IGNORECASE
+        ) if self._all_job_keywords else None
+
+        # Job titles repeat across runs of the scorer; remember each
+        # title's tier so the regex scans happen once per unique title
+        self._category_priority_cache = {}
+
+    def matches_job_keywords(self, job_title: str) -> bool:
+        """Check whether a job title contains any configured keyword."""
+        if self._keyword_pattern is None:
+            return False
+        return self._keyword_pattern.search(job_title) is not None
+
     @property
     def all_job_keywords(self) -> List[str]:
         """Get all job keywords in priority order."""
-        return (self.job_keywords_research + 
-                self.job_keywords_ai_ml + 
-                self.job_keywords_internship + 
-                self.job_keywords_engineer)
+        return self._all_job_keywords
     
     def get_job_category_priority(self, job_title: str) -> int:
         """Get priority score for a job based on title (lower = higher priority)."""
-        job_title_lower = job_title.lower()
-        
-        # Research = 1 (highest priority)
-        if any(keyword.lower() in job_title_lower for keyword in self.job_keywords_research):
-            return 1
-            
-        # AI/ML = 2
-        if any(keyword.lower() in job_title_lower for keyword in self.job_keywords_ai_ml):
-            return 2
-            
-        # Internship = 3
-        if any(keyword.lower() in job_title_lower for keyword in self.job_keywords_internship):
-            return 3
-            
-        # Engineer = 4
-        if any(keyword.lower() in job_title_lower for keyword in self.job_keywords_engineer):
-            return 4
-            
-        # Other = 5 (lowest priority)
-        return 5
+
+        cached = self._category_priority_cache.get(job_title)
+        if cached is not None:
+            return cached
+
+        # Tiers checked in priority order: Research=1, AI/ML=2, Internship=3, Engineer=4
+        score = 5  # Other = lowest priority
+        for tier_score, pattern in self._tier_patterns:
+            if pattern.search(job_title):
+                score = tier_score
+                break
+
+        self._category_priority_cache[job_title] = score
+        return score
     
     def get_priority_level_score(self, priority: str) -> int:
         """Convert priority level to numeric score (lower = higher priority)."""
-        priority_map = {
-            "High Prior": 1,
-            "Mid Prior": 2,
-            "Low Prior": 3,
-            "": 4  # No priority set
-        }
-        return priority_map.get(priority, 4)
+        return _PRIORITY_MAP.get(priority, 4)
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the shared Config instance.
+
+    Loading settings re-reads .env and recompiles the keyword patterns,
+    so callers share one cached instance instead of constructing their own.
+    """
+    return Config()
 
 def create_sample_env():
     """Create a sample .env file for user reference."""
@@ -9,18 +9,29 @@ import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 
-from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 
-from config import Config
-from notion_api import NotionClient
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None  # Optional - fall back to the default event loop
+
+from config import get_config
+from notion_api import get_notion_client
 from task_processor import TaskProcessor
 from page_generator import PageGenerator
 from cli_interface import CLIInterface
-from utils import setup_logging, handle_errors
+from utils import setup_logging, handle_errors, console
+
 
-console = Console()
+# Static banner - built once so each run skips Rich markup re-parsing
+_WELCOME_PANEL = Panel(
+    Text("🚀 AI Task Continuity System", style="bold blue"),
+    title="Welcome",
+    padding=(1, 2)
+)
 
 @handle_errors
 async def main():
@@ -31,16 +42,16 @@ async def main():
     logger.info("Starting AI Task Continuity System")
     
     # Display welcome message
-    welcome_text = Text("🚀 AI Task Continuity System", style="bold blue")
-    console.print(Panel(welcome_text, title="Welcome", padding=(1, 2)))
+    console.print(_WELCOME_PANEL)
     
+    notion = None
     try:
         # Initialize configuration
-        config = Config()
+        config = get_config()
         console.print("✓ Configuration loaded", style="green")
         
         # Initialize Notion client
-        notion = NotionClient(config.notion_api_key)
+        notion = get_notion_client(config.notion_api_key)
         await notion.validate_connection()
         console.print("✓ Notion API connection validated", style="green")
         
@@ -55,14 +66,16 @@ async def main():
         
         console.print(f"📅 Processing tasks from {today} → {tomorrow}", style="yellow")
         
-        # Step 1: Collect uncompleted tasks
-        console.print("\n🔍 Scanning uncompleted tasks...", style="cyan")
-        uncompleted_tasks = await task_processor.get_uncompleted_tasks(today)
+        # Steps 1 + 2: Collect uncompleted tasks and feature jobs concurrently -
+        # they hit independent databases, so the two round-trips overlap
+        console.print("\n🔍 Scanning uncompleted tasks and job opportunities...", style="cyan")
+        uncompleted_tasks, feature_jobs = await asyncio.gather(
+            task_processor.get_uncompleted_tasks(today),
+            task_processor.get_feature_jobs()
+        )
+        task_processor.display_uncompleted_tasks(uncompleted_tasks, today)
+        task_processor.display_job_selection()
         console.print(f"Found {len(uncompleted_tasks)} uncompleted tasks", style="green")
-        
-        # Step 2: Get and filter feature jobs
-        console.print("\n💼 Analyzing job opportunities...", style="cyan")
-        feature_jobs = await task_processor.get_feature_jobs()
         console.print(f"Selected {len(feature_jobs)} priority jobs", style="green")
         
         # Step 3: Create carryover tasks
@@ -75,11 +88,15 @@ async def main():
         page_content = page_generator.generate_page_content(carryover_tasks, feature_jobs, tomorrow)
         
         # Step 5: User review and approval
+        # Warm the Notion schema in the background while the user reviews -
+        # prompts run in a worker thread so this overlaps think-time
+        prefetch = asyncio.create_task(task_processor.prefetch_database_schema())
         console.print("\n👀 Review Phase", style="bold yellow")
         approved_content = await cli.review_and_edit(page_content, carryover_tasks, feature_jobs)
-        
+
         # Step 6: Publish final version
         console.print("\n🚀 Publishing tomorrow's plan...", style="cyan")
+        await prefetch
         page_url = await page_generator.create_tomorrow_page(approved_content, tomorrow)
         await task_processor.create_database_entries(approved_content['carryover_tasks'])
         
@@ -94,6 +111,9 @@ async def main():
         logger.error(f"Unexpected error: {e}")
         console.print(f"\n❌ Error: {e}", style="red")
         sys.exit(1)
+    finally:
+        if notion is not None:
+            await notion.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
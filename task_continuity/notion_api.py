@@ -4,22 +4,44 @@ Designed specifically for the AI Task Continuity System.
 """
 
 import asyncio
-import time
-from datetime import datetime, date
+import logging
+from datetime import date
 from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass
 
-import requests
-from notion_client import Client
-from notion_client.errors import APIResponseError, RequestTimeoutError
-from rich.console import Console
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from utils import retry_with_exponential_backoff, format_date_for_notion
+from utils import console
 
-console = Console()
+logger = logging.getLogger("task_continuity.notion")
 
-@dataclass
+NOTION_API_BASE = "https://api.notion.com/v1"
+NOTION_VERSION = "2022-06-28"
+
+# Static query fragments - only the date leaf changes between calls, so
+# the skeletons are built once at import instead of per query
+_STATUS_FALSE_FILTER = {
+    "property": "Status",
+    "checkbox": {
+        "equals": False
+    }
+}
+_JOB_SORTS = [
+    {
+        "property": "Deadline",
+        "direction": "ascending"
+    },
+    {
+        "property": "Priority",
+        "direction": "ascending"
+    }
+]
+
+@dataclass(slots=True)
 class Task:
     """Represents a task from the Plan AI database."""
     id: str
@@ -31,25 +53,46 @@ class Task:
     
     @classmethod
     def from_notion_page(cls, page: Dict[str, Any]) -> 'Task':
-        """Create Task from Notion page data."""
+        """Create Task from Notion page data.
+
+        Runs once per fetched page, so the missing-property cases are
+        handled with try/except on direct subscripts instead of chained
+        .get() calls that allocate throwaway default dicts.
+        """
         props = page['properties']
-        
-        # Extract date from Next reminder
-        next_reminder = None
-        if props.get('Next reminder') and props['Next reminder'].get('date'):
-            date_str = props['Next reminder']['date']['start']
-            next_reminder = datetime.fromisoformat(date_str.replace('Z', '+00:00')).date()
-        
+
+        # Extract date from Next reminder - the first 10 chars of a
+        # Notion date are always YYYY-MM-DD, which date.fromisoformat
+        # parses without a full datetime/timezone round-trip
+        try:
+            next_reminder = date.fromisoformat(props['Next reminder']['date']['start'][:10])
+        except (KeyError, TypeError):
+            next_reminder = None
+
+        title_arr = props['Name']['title']
+
+        try:
+            priority_level = props['Priority Level']['select']['name']
+        except (KeyError, TypeError):
+            priority_level = ''
+
+        try:
+            category = props['Category']['select']['name']
+        except (KeyError, TypeError):
+            category = ''
+
+        status = props.get('Status')
+
         return cls(
             id=page['id'],
-            name=props['Name']['title'][0]['plain_text'] if props['Name']['title'] else '',
-            status=props.get('Status', {}).get('checkbox', False),
+            name=title_arr[0]['plain_text'] if title_arr else '',
+            status=status['checkbox'] if status else False,
             next_reminder=next_reminder,
-            priority_level=props.get('Priority Level', {}).get('select', {}).get('name', ''),
-            category=props.get('Category', {}).get('select', {}).get('name', '')
+            priority_level=priority_level,
+            category=category
         )
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Represents a job from the Job Tracker database."""
     id: str
@@ -60,50 +103,165 @@ class Job:
     
     @classmethod
     def from_notion_page(cls, page: Dict[str, Any]) -> 'Job':
-        """Create Job from Notion page data."""
+        """Create Job from Notion page data.
+
+        Same direct-subscript parsing strategy as Task.from_notion_page.
+        """
         props = page['properties']
-        
+
         # Extract deadline
-        deadline = None
-        if props.get('Deadline') and props['Deadline'].get('date'):
-            date_str = props['Deadline']['date']['start']
-            deadline = datetime.fromisoformat(date_str.replace('Z', '+00:00')).date()
-        
+        try:
+            deadline = date.fromisoformat(props['Deadline']['date']['start'][:10])
+        except (KeyError, TypeError):
+            deadline = None
+
         # Extract application link
-        app_link = None
-        if props.get('Application Link') and props['Application Link'].get('url'):
+        try:
             app_link = props['Application Link']['url']
-        
+        except (KeyError, TypeError):
+            app_link = None
+
+        try:
+            priority = props['Priority']['select']['name']
+        except (KeyError, TypeError):
+            priority = ''
+
+        title_arr = props['Name']['title']
+
         return cls(
             id=page['id'],
-            name=props['Name']['title'][0]['plain_text'] if props['Name']['title'] else '',
+            name=title_arr[0]['plain_text'] if title_arr else '',
             deadline=deadline,
-            priority=props.get('Priority', {}).get('select', {}).get('name', ''),
+            priority=priority,
             application_link=app_link
         )
 
 class NotionClient:
     """Enhanced Notion API client with robust error handling and rate limiting."""
     
-    def __init__(self, api_key: str, rate_limit_delay: float = 0.34):
-        self.client = Client(auth=api_key)
-        self.rate_limit_delay = rate_limit_delay
-        self.last_request_time = 0.0
-        
-    async def _rate_limit(self):
-        """Enforce rate limiting between API calls."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            await asyncio.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
-    
+    def __init__(self, api_key: str, requests_per_second: float = 3.0, quiet: bool = False):
+        # Direct async REST client - one pooled TLS connection is reused
+        # across every request instead of a handshake per call
+        self._http = httpx.AsyncClient(
+            base_url=NOTION_API_BASE,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "Notion-Version": NOTION_VERSION
+            },
+            timeout=30.0,
+            # Connect-level retries happen inside the transport, where the
+            # pooled connection survives - no Python-level re-entry and no
+            # fresh TLS handshake per attempt. Pool limits must live on
+            # the transport too: httpx ignores a client-level limits=
+            # argument when an explicit transport is supplied
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+            )
+        )
+        # Token bucket: concurrent coroutines may burst up to the real
+        # API budget instead of being forced into fixed 1/rps gaps
+        self._limiter = AsyncLimiter(requests_per_second, 1)
+        # Per-run cache filled by batched date queries so repeat
+        # single-date lookups skip the network entirely
+        self._tasks_by_date: Dict[tuple, List['Task']] = {}
+        # Spinners spawn a refresh thread and write cursor ops - pointless
+        # under cron/CI, so they are skipped when not attached to a TTY
+        self._show_progress = console.is_terminal and not quiet
+        # Identical queries within one run resolve from this map; storing
+        # futures also coalesces concurrent duplicates into one request
+        self._query_cache: Dict[tuple, asyncio.Future] = {}
+
+    async def aclose(self):
+        """Release the pooled HTTP connections."""
+        global _shared_client
+        if _shared_client is self:
+            _shared_client = None
+        await self._http.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """Issue one rate-limited request and return the decoded body."""
+
+        # orjson serializes the deeply-nested Notion payloads several
+        # times faster than httpx's stdlib-json default
+        payload = kwargs.pop('json', None)
+        if payload is not None:
+            kwargs['content'] = orjson.dumps(payload)
+            kwargs.setdefault('headers', {})['Content-Type'] = 'application/json'
+
+        while True:
+            async with self._limiter:
+                response = await self._http.request(method, path, **kwargs)
+
+            if response.status_code == 429:
+                # Honor the server's backoff hint, then re-enter the bucket
+                retry_after = float(response.headers.get("Retry-After", 1.0))
+                await asyncio.sleep(retry_after)
+                continue
+
+            response.raise_for_status()
+            return orjson.loads(response.content)
+
+    # Thin endpoint wrappers - the five Notion REST calls this system
+    # actually uses, each one rate-limited _request invocation
+
+    def _list_users(self):
+        return self._request("GET", "/users")
+
+    def _query_db(self, database_id: str, params: Dict[str, Any]):
+        return self._request("POST", f"/databases/{database_id}/query", json=params)
+
+    def _retrieve_db(self, database_id: str):
+        return self._request("GET", f"/databases/{database_id}")
+
+    def _create_page_raw(self, payload: Dict[str, Any]):
+        return self._request("POST", "/pages", json=payload)
+
+    def _update_page_raw(self, page_id: str, properties: Dict[str, Any]):
+        return self._request("PATCH", f"/pages/{page_id}", json={"properties": properties})
+
+    def _append_children(self, block_id: str, children: List[Dict[str, Any]]):
+        return self._request("PATCH", f"/blocks/{block_id}/children", json={"children": children})
+
+    async def _query_all_pages(
+        self,
+        database_id: str,
+        query_params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Drain every page of a database query.
+
+        Notion only hands out cursors serially, so full fan-out is
+        impossible - instead the fetch for page N+1 is scheduled the
+        moment page N's cursor is parsed, overlapping it with result
+        handling.
+        """
+        response = await self._query_db(database_id, query_params)
+        results = response['results']
+
+        next_page = None
+        if response.get('has_more'):
+            next_page = asyncio.create_task(self._query_db(
+                database_id, {**query_params, "start_cursor": response['next_cursor']}
+            ))
+
+        while next_page is not None:
+            response = await next_page
+            if response.get('has_more'):
+                next_page = asyncio.create_task(self._query_db(
+                    database_id, {**query_params, "start_cursor": response['next_cursor']}
+                ))
+            else:
+                next_page = None
+            results.extend(response['results'])
+
+        return results
+
     @retry_with_exponential_backoff(max_retries=3)
     async def validate_connection(self) -> bool:
         """Validate Notion API connection and permissions."""
         try:
-            await self._rate_limit()
             # Test connection by listing users
-            response = self.client.users.list()
+            await self._list_users()
             console.print("🔗 Notion API connection validated", style="dim green")
             return True
         except Exception as e:
@@ -117,58 +275,90 @@ class NotionClient:
         filters: Optional[Dict[str, Any]] = None,
         sorts: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
-        """Get all items from a Notion database with optional filtering and sorting."""
-        
-        await self._rate_limit()
-        
-        query_params = {}
+        """Get all items from a Notion database with optional filtering and sorting.
+
+        Repeated identical queries within a run return the cached result
+        list, and concurrent duplicates await the same in-flight request.
+        Callers must not mutate the returned list.
+        """
+
+        cache_key = (
+            database_id,
+            orjson.dumps(filters or {}, option=orjson.OPT_SORT_KEYS),
+            orjson.dumps(sorts or [])
+        )
+        in_flight = self._query_cache.get(cache_key)
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._query_cache[cache_key] = future
+
+        # Always ask for the maximum page size so large databases need as
+        # few round-trips as possible
+        query_params = {'page_size': 100}
         if filters:
             query_params['filter'] = filters
         if sorts:
             query_params['sorts'] = sorts
-        
+
         try:
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=console,
-                transient=True
-            ) as progress:
-                task = progress.add_task(f"Querying database {database_id[:8]}...", total=None)
-                
-                response = self.client.databases.query(database_id, **query_params)
-                results = response['results']
-                
-                # Handle pagination
-                while response.get('has_more'):
-                    await self._rate_limit()
-                    response = self.client.databases.query(
-                        database_id, 
-                        start_cursor=response['next_cursor'],
-                        **query_params
-                    )
-                    results.extend(response['results'])
-                
-                progress.update(task, completed=True)
-                return results
-                
-        except APIResponseError as e:
-            if e.status == 404:
+            if self._show_progress:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    console=console,
+                    transient=True
+                ) as progress:
+                    task = progress.add_task(f"Querying database {database_id[:8]}...", total=None)
+                    results = await self._query_all_pages(database_id, query_params)
+                    progress.update(task, completed=True)
+            else:
+                results = await self._query_all_pages(database_id, query_params)
+
+            future.set_result(results)
+            return results
+
+        except httpx.HTTPStatusError as e:
+            self._fail_query_future(cache_key, future, e)
+            status = e.response.status_code
+            if status == 404:
                 console.print(f"❌ Database not found: {database_id}", style="red")
                 console.print("Check database ID and Notion integration permissions", style="yellow")
-            elif e.status == 403:
+            elif status == 403:
                 console.print(f"❌ No access to database: {database_id}", style="red")
                 console.print("Grant integration access to this database in Notion", style="yellow")
             else:
-                console.print(f"❌ API Error: {e.status} - {e.body}", style="red")
+                console.print(f"❌ API Error: {status} - {e.response.text}", style="red")
             raise
         except Exception as e:
+            self._fail_query_future(cache_key, future, e)
             console.print(f"❌ Unexpected error querying database: {e}", style="red")
             raise
+        finally:
+            # Cancellation is a BaseException and skips the handlers
+            # above; without this sweep the pending future would stay
+            # cached and every coalesced duplicate would await it forever
+            if not future.done():
+                self._query_cache.pop(cache_key, None)
+                future.cancel()
+
+    def _fail_query_future(self, cache_key: tuple, future: asyncio.Future, error: Exception):
+        """Propagate a query failure to coalesced waiters and evict it."""
+        self._query_cache.pop(cache_key, None)
+        future.set_exception(error)
+        # Mark retrieved so lone failures don't log 'never retrieved'
+        future.exception()
     
     async def get_tasks_by_date(self, database_id: str, target_date: date) -> List[Task]:
         """Get tasks scheduled for a specific date."""
-        
+
+        # Served from the local cache when a batched query already
+        # covered this date in the current run
+        cached = self._tasks_by_date.get((database_id, target_date))
+        if cached is not None:
+            return cached
+
         # Create date filter
         date_filter = {
             "property": "Next reminder",
@@ -176,9 +366,47 @@ class NotionClient:
                 "equals": format_date_for_notion(target_date)
             }
         }
-        
+
         pages = await self.get_database_items(database_id, filters=date_filter)
-        return [Task.from_notion_page(page) for page in pages]
+        tasks = list(map(Task.from_notion_page, pages))
+        self._tasks_by_date[(database_id, target_date)] = tasks
+        return tasks
+
+    async def get_tasks_by_dates(
+        self,
+        database_id: str,
+        dates: List[date]
+    ) -> Dict[date, List[Task]]:
+        """Get tasks for several dates with a single compound query.
+
+        One or-filtered query replaces a round-trip per date; results are
+        bucketed locally and cached so later get_tasks_by_date calls for
+        the same dates are free.
+        """
+
+        or_filter = {
+            "or": [
+                {
+                    "property": "Next reminder",
+                    "date": {
+                        "equals": format_date_for_notion(target_date)
+                    }
+                }
+                for target_date in dates
+            ]
+        }
+
+        pages = await self.get_database_items(database_id, filters=or_filter)
+
+        buckets: Dict[date, List[Task]] = {target_date: [] for target_date in dates}
+        for task in map(Task.from_notion_page, pages):
+            if task.next_reminder in buckets:
+                buckets[task.next_reminder].append(task)
+
+        for target_date, tasks in buckets.items():
+            self._tasks_by_date[(database_id, target_date)] = tasks
+
+        return buckets
     
     async def get_uncompleted_tasks_by_date(self, database_id: str, target_date: date) -> List[Task]:
         """Get uncompleted tasks scheduled for a specific date."""
@@ -192,36 +420,51 @@ class NotionClient:
                         "equals": format_date_for_notion(target_date)
                     }
                 },
-                {
-                    "property": "Status",
-                    "checkbox": {
-                        "equals": False
-                    }
-                }
+                _STATUS_FALSE_FILTER
             ]
         }
-        
+
         pages = await self.get_database_items(database_id, filters=compound_filter)
-        return [Task.from_notion_page(page) for page in pages]
+        return list(map(Task.from_notion_page, pages))
     
+    async def prefetch_daily(
+        self,
+        task_database_id: str,
+        job_database_id: str,
+        target_date: date
+    ) -> tuple:
+        """Fetch the day's uncompleted tasks and all jobs concurrently.
+
+        The two queries hit independent databases, so their round-trips
+        overlap; the limiter still caps the combined burst at the API
+        budget. Returns (tasks, jobs).
+        """
+        return await asyncio.gather(
+            self.get_uncompleted_tasks_by_date(task_database_id, target_date),
+            self.get_all_jobs(job_database_id)
+        )
+
     async def get_all_jobs(self, database_id: str) -> List[Job]:
         """Get all jobs from the Job Tracker database."""
-        
+
         # Sort by deadline (ascending) and priority
-        sorts = [
-            {
-                "property": "Deadline",
-                "direction": "ascending"
-            },
-            {
-                "property": "Priority",
-                "direction": "ascending"
-            }
-        ]
-        
-        pages = await self.get_database_items(database_id, sorts=sorts)
-        return [Job.from_notion_page(page) for page in pages]
+        pages = await self.get_database_items(database_id, sorts=_JOB_SORTS)
+        return list(map(Job.from_notion_page, pages))
     
+    @retry_with_exponential_backoff(max_retries=3)
+    async def get_database_schema(self, database_id: str) -> Dict[str, Any]:
+        """Retrieve database metadata (properties, select options, etc.)."""
+
+        try:
+            return await self._retrieve_db(database_id)
+        except httpx.HTTPStatusError as e:
+            console.print(
+                f"❌ Failed to retrieve database schema: "
+                f"{e.response.status_code} - {e.response.text}",
+                style="red"
+            )
+            raise
+
     @retry_with_exponential_backoff(max_retries=3)
     async def create_database_item(
         self, 
@@ -229,19 +472,27 @@ class NotionClient:
         properties: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Create a new item in a Notion database."""
-        
-        await self._rate_limit()
-        
+
         try:
-            response = self.client.pages.create(
-                parent={"database_id": database_id},
-                properties=properties
-            )
-            console.print(f"✓ Created database item: {properties.get('Name', {}).get('title', [{}])[0].get('text', {}).get('content', 'Unknown')}", style="dim green")
+            response = await self._create_page_raw({
+                "parent": {"database_id": database_id},
+                "properties": properties
+            })
+            # The database changed - cached query results are now stale
+            self._query_cache.clear()
+            self._tasks_by_date.clear()
+            # Per-item confirmations go to debug logging - rendering and
+            # flushing an ANSI line per created row is measurable in bulk
+            # runs, and the caller already prints one summary at the end
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Created database item: %s",
+                    properties.get('Name', {}).get('title', [{}])[0].get('text', {}).get('content', 'Unknown')
+                )
             return response
-            
-        except APIResponseError as e:
-            console.print(f"❌ Failed to create database item: {e.status} - {e.body}", style="red")
+
+        except httpx.HTTPStatusError as e:
+            console.print(f"❌ Failed to create database item: {e.response.status_code} - {e.response.text}", style="red")
             raise
         except Exception as e:
             console.print(f"❌ Unexpected error creating database item: {e}", style="red")
@@ -254,14 +505,17 @@ class NotionClient:
         title: str, 
         content: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """Create a new Notion page."""
-        
-        await self._rate_limit()
-        
+        """Create a new Notion page.
+
+        Notion caps children at 100 per request, so oversized bodies are
+        created with the first chunk and the remainder appended in
+        100-block batches.
+        """
+
         try:
-            response = self.client.pages.create(
-                parent={"page_id": parent_id},
-                properties={
+            response = await self._create_page_raw({
+                "parent": {"page_id": parent_id},
+                "properties": {
                     "title": {
                         "title": [
                             {
@@ -272,13 +526,17 @@ class NotionClient:
                         ]
                     }
                 },
-                children=content
-            )
+                "children": content[:100]
+            })
+
+            for start in range(100, len(content), 100):
+                await self._append_children(response['id'], content[start:start + 100])
+
             console.print(f"✓ Created page: {title}", style="green")
             return response
-            
-        except APIResponseError as e:
-            console.print(f"❌ Failed to create page: {e.status} - {e.body}", style="red")
+
+        except httpx.HTTPStatusError as e:
+            console.print(f"❌ Failed to create page: {e.response.status_code} - {e.response.text}", style="red")
             raise
         except Exception as e:
             console.print(f"❌ Unexpected error creating page: {e}", style="red")
@@ -292,28 +550,41 @@ class NotionClient:
         content: List[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Update an existing Notion page."""
-        
-        await self._rate_limit()
-        
+
         try:
             # Update properties if provided
             if properties:
-                response = self.client.pages.update(page_id, properties=properties)
-                
-            # Append content if provided
-            if content:
-                self.client.blocks.children.append(page_id, children=content)
-                
-            console.print("✓ Updated page successfully", style="dim green")
+                response = await self._update_page_raw(page_id, properties)
+
+            # Append content if provided, batched to the 100-child cap
+            for start in range(0, len(content or ()), 100):
+                await self._append_children(page_id, content[start:start + 100])
+
+            logger.debug("Updated page %s", page_id)
             return response if properties else {"success": True}
-            
-        except APIResponseError as e:
-            console.print(f"❌ Failed to update page: {e.status} - {e.body}", style="red")
+
+        except httpx.HTTPStatusError as e:
+            console.print(f"❌ Failed to update page: {e.response.status_code} - {e.response.text}", style="red")
             raise
         except Exception as e:
             console.print(f"❌ Unexpected error updating page: {e}", style="red")
             raise
 
+# Process-wide client so every entry point shares one connection pool -
+# TCP and TLS setup is paid once instead of per NotionClient
+_shared_client: Optional[NotionClient] = None
+
+def get_notion_client(api_key: str) -> NotionClient:
+    """Return the shared NotionClient, creating it on first use.
+
+    Callers should release it with ``await client.aclose()`` when the
+    process is done talking to Notion.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = NotionClient(api_key)
+    return _shared_client
+
 # Utility functions for creating Notion properties
 def create_task_properties(
     name: str,
@@ -6,18 +6,18 @@ Helps users install dependencies and validate their configuration.
 
 import asyncio
 import os
+import shutil
 import sys
 import subprocess
 from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.text import Text
 
-console = Console()
+from utils import console
 
 def check_python_version():
     """Check if Python version is compatible."""
@@ -30,16 +30,57 @@ def check_python_version():
     console.print(f"✅ Python version: {sys.version.split()[0]}", style="green")
     return True
 
+def find_missing_requirements(requirements_file: Path) -> Optional[list]:
+    """Return requirement lines not satisfied by the current environment.
+
+    Checks installed versions with importlib.metadata so repeat setup runs
+    can skip pip entirely. Returns None if the check itself isn't possible
+    (e.g. packaging unavailable), meaning pip should run unconditionally.
+    """
+
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+        from packaging.requirements import Requirement
+    except ImportError:
+        return None
+
+    missing = []
+    for line in requirements_file.read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            requirement = Requirement(line)
+        except Exception:
+            return None
+        if requirement.marker is not None and not requirement.marker.evaluate():
+            continue
+        try:
+            installed = version(requirement.name)
+        except PackageNotFoundError:
+            missing.append(line)
+            continue
+        if not requirement.specifier.contains(installed, prereleases=True):
+            missing.append(line)
+
+    return missing
+
 def install_dependencies():
     """Install required Python packages."""
-    
+
     console.print("📦 Installing dependencies...", style="blue")
-    
+
     requirements_file = Path("requirements.txt")
     if not requirements_file.exists():
         console.print("❌ requirements.txt not found", style="red")
         return False
-    
+
+    # Fast path: skip pip when everything is already satisfied
+    missing = find_missing_requirements(requirements_file)
+    if missing is not None and not missing:
+        console.print("✅ Dependencies already satisfied", style="green")
+        return True
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -47,16 +88,21 @@ def install_dependencies():
             console=console
         ) as progress:
             task = progress.add_task("Installing packages...", total=None)
-            
-            result = subprocess.run([
-                sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
-            ], capture_output=True, text=True, check=True)
-            
+
+            if missing:
+                result = subprocess.run([
+                    sys.executable, "-m", "pip", "install", *missing
+                ], capture_output=True, text=True, check=True)
+            else:
+                result = subprocess.run([
+                    sys.executable, "-m", "pip", "install", "-r", "requirements.txt"
+                ], capture_output=True, text=True, check=True)
+
             progress.update(task, completed=True)
-        
+
         console.print("✅ Dependencies installed successfully", style="green")
         return True
-        
+
     except subprocess.CalledProcessError as e:
         console.print(f"❌ Failed to install dependencies: {e}", style="red")
         console.print(f"Error output: {e.stderr}", style="dim red")
@@ -79,12 +125,8 @@ def create_env_file():
         console.print("❌ .env.sample not found", style="red")
         return False
     
-    # Copy sample to .env
-    with open(env_sample, 'r') as f:
-        sample_content = f.read()
-    
-    with open(env_file, 'w') as f:
-        f.write(sample_content)
+    # Copy sample to .env (copyfile uses zero-copy sendfile where available)
+    shutil.copyfile(env_sample, env_file)
     
     console.print("✅ Created .env file from template", style="green")
     console.print("📝 Please edit .env with your Notion configuration", style="yellow")
@@ -115,45 +157,43 @@ async def validate_configuration():
     console.print("🔍 Validating configuration...", style="blue")
     
     try:
-        from config import Config
+        from config import get_config
         
         console.print("✅ Configuration loaded", style="green")
-        config = Config()
+        config = get_config()
         
         # Test Notion connection
         console.print("🔗 Testing Notion API connection...", style="blue")
         
-        from notion_api import NotionClient
-        notion = NotionClient(config.notion_api_key)
+        from notion_api import get_notion_client
+        notion = get_notion_client(config.notion_api_key)
         
         await notion.validate_connection()
         console.print("✅ Notion API connection successful", style="green")
         
-        # Test database access
+        # Test database access - both queries overlap; the connection
+        # check above already proved the credentials
         console.print("📊 Testing database access...", style="blue")
-        
-        # Test Plan AI database
-        try:
-            tasks = await notion.get_database_items(
-                config.plan_ai_database_id,
-                filters=None
-            )
+
+        tasks, jobs = await asyncio.gather(
+            notion.get_database_items(config.plan_ai_database_id, filters=None),
+            notion.get_database_items(config.job_tracker_database_id, filters=None),
+            return_exceptions=True
+        )
+
+        if isinstance(tasks, Exception):
+            console.print(f"❌ Plan AI database error: {tasks}", style="red")
+        else:
             console.print(f"✅ Plan AI database accessible ({len(tasks)} items)", style="green")
-        except Exception as e:
-            console.print(f"❌ Plan AI database error: {e}", style="red")
-            return False
-        
-        # Test Job Tracker database
-        try:
-            jobs = await notion.get_database_items(
-                config.job_tracker_database_id,
-                filters=None
-            )
+
+        if isinstance(jobs, Exception):
+            console.print(f"❌ Job Tracker database error: {jobs}", style="red")
+        else:
             console.print(f"✅ Job Tracker database accessible ({len(jobs)} items)", style="green")
-        except Exception as e:
-            console.print(f"❌ Job Tracker database error: {e}", style="red")
+
+        if isinstance(tasks, Exception) or isinstance(jobs, Exception):
             return False
-        
+
         console.print("🎉 Configuration validation complete!", style="bold green")
         return True
         
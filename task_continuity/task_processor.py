@@ -3,18 +3,19 @@ Task Processing Logic for AI Task Continuity System
 Handles carryover rules, job filtering, and intelligent task selection.
 """
 
+import asyncio
+import bisect
+import heapq
 import logging
-from datetime import date, datetime, timedelta
+from collections import Counter, defaultdict
+from datetime import date
 from typing import List, Dict, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from config import Config
+from config import Config, _PRIORITY_MAP
 from notion_api import NotionClient, Task, Job, create_task_properties
 from utils import (
+    console,
     format_date_for_display,
     get_days_until_deadline,
     format_deadline_urgency,
@@ -23,9 +24,13 @@ from utils import (
     create_priority_badge
 )
 
-console = Console()
 logger = logging.getLogger("task_continuity")
 
+# Deadline urgency buckets: overdue=0, due today/tomorrow=1, within 3
+# days=2, within a week=3, later=4. bisect_right over the upper bounds
+# replaces the old if/elif chain with one table lookup
+_URGENCY_BOUNDS = (0, 2, 4, 8)
+
 @dataclass
 class ProcessedJob:
     """Enhanced Job data with processing metadata."""
@@ -39,23 +44,17 @@ class ProcessedJob:
     def from_job(cls, job: Job, config: Config) -> 'ProcessedJob':
         """Create ProcessedJob with scoring."""
         category_priority = config.get_job_category_priority(job.name)
-        priority_score = config.get_priority_level_score(job.priority)
+        # Tiny static domain - read the shared map directly rather than
+        # paying a method call per job
+        priority_score = _PRIORITY_MAP.get(job.priority, 4)
         
         # Calculate deadline urgency (sooner = lower score = higher priority)
         days_until = get_days_until_deadline(job.deadline)
         if days_until is None:
             deadline_urgency = 100  # No deadline = lowest urgency
-        elif days_until < 0:
-            deadline_urgency = 0  # Overdue = highest urgency
-        elif days_until <= 1:
-            deadline_urgency = 1  # Due today/tomorrow
-        elif days_until <= 3:
-            deadline_urgency = 2  # Due within 3 days
-        elif days_until <= 7:
-            deadline_urgency = 3  # Due within a week
         else:
-            deadline_urgency = 4  # Due later
-        
+            deadline_urgency = bisect.bisect_right(_URGENCY_BOUNDS, days_until)
+
         # Total score (lower = higher priority)
         total_score = category_priority + priority_score + deadline_urgency
         
@@ -68,54 +67,66 @@ class ProcessedJob:
         )
 
 class TaskProcessor:
-    """Core logic processor for task continuity and job selection."""
-    
+    """Core logic processor for task continuity and job selection.
+
+    get_uncompleted_tasks and get_feature_jobs hit independent databases,
+    so callers should run them under one asyncio.gather. Console output
+    is deferred to display_uncompleted_tasks / display_job_selection so
+    parallel fetches don't interleave their tables.
+    """
+
     def __init__(self, notion_client: NotionClient, config: Config):
         self.notion = notion_client
         self.config = config
         self.logger = logging.getLogger("task_continuity.processor")
-    
+        self._last_job_selection: Optional[Tuple[List[ProcessedJob], List[ProcessedJob]]] = None
+        self._carryover_categories: Optional[Dict[str, List[Task]]] = None
+
     async def get_uncompleted_tasks(self, target_date: date) -> List[Task]:
         """Get all uncompleted tasks scheduled for the target date."""
-        
+
         self.logger.info(f"Fetching uncompleted tasks for {target_date}")
-        
+
         try:
             tasks = await self.notion.get_uncompleted_tasks_by_date(
                 self.config.plan_ai_database_id,
                 target_date
             )
-            
-            # Log summary
+
             if tasks:
-                categories = categorize_tasks_by_category(tasks)
-                self.logger.info(f"Found {len(tasks)} uncompleted tasks across {len(categories)} categories")
-                
-                # Display breakdown
-                table = Table(title=f"Uncompleted Tasks - {format_date_for_display(target_date)}")
-                table.add_column("Category", style="cyan")
-                table.add_column("Count", style="yellow")
-                table.add_column("Priority Breakdown", style="green")
-                
-                for category, category_tasks in categories.items():
-                    priority_counts = {}
-                    for task in category_tasks:
-                        priority = task.priority_level or "None"
-                        priority_counts[priority] = priority_counts.get(priority, 0) + 1
-                    
-                    priority_breakdown = ", ".join([f"{p}: {c}" for p, c in priority_counts.items()])
-                    table.add_row(category, str(len(category_tasks)), priority_breakdown)
-                
-                console.print(table)
-            else:
-                console.print("🎉 No uncompleted tasks found - great job!", style="green")
-            
+                self.logger.info(f"Found {len(tasks)} uncompleted tasks")
+
             return tasks
-            
+
         except Exception as e:
             self.logger.error(f"Failed to fetch uncompleted tasks: {e}")
             console.print(f"❌ Failed to fetch uncompleted tasks: {e}", style="red")
             raise
+
+    def display_uncompleted_tasks(self, tasks: List[Task], target_date: date):
+        """Render the per-category breakdown of uncompleted tasks."""
+
+        if not tasks:
+            console.print("🎉 No uncompleted tasks found - great job!", style="green")
+            return
+
+        from rich.table import Table  # deferred: only display paths pay for it
+
+        categories = categorize_tasks_by_category(tasks)
+
+        table = Table(title=f"Uncompleted Tasks - {format_date_for_display(target_date)}")
+        table.add_column("Category", style="cyan")
+        table.add_column("Count", style="yellow")
+        table.add_column("Priority Breakdown", style="green")
+
+        for category, category_tasks in categories.items():
+            priority_counts = Counter(
+                (task.priority_level or "None") for task in category_tasks
+            )
+            priority_breakdown = ", ".join(f"{p}: {c}" for p, c in priority_counts.items())
+            table.add_row(category, str(len(category_tasks)), priority_breakdown)
+
+        console.print(table)
     
     async def get_feature_jobs(self) -> List[Job]:
         """Get and intelligently filter jobs for Feature Jobs section."""
@@ -127,6 +138,7 @@ class TaskProcessor:
             all_jobs = await self.notion.get_all_jobs(self.config.job_tracker_database_id)
             
             if not all_jobs:
+                self._last_job_selection = None
                 console.print("⚠️  No jobs found in Job Tracker database", style="yellow")
                 return []
             
@@ -135,27 +147,31 @@ class TaskProcessor:
             
             for job in all_jobs:
                 # Check if job matches any feature keywords
-                if any(keyword.lower() in job.name.lower() 
-                       for keyword in self.config.all_job_keywords):
+                if self.config.matches_job_keywords(job.name):
                     processed_job = ProcessedJob.from_job(job, self.config)
                     feature_candidates.append(processed_job)
             
             if not feature_candidates:
+                self._last_job_selection = None
                 console.print("⚠️  No AI/Research jobs found matching criteria", style="yellow")
                 return []
             
-            # Sort by total score (lower score = higher priority)
-            feature_candidates.sort(key=lambda x: x.total_score)
-            
+            # Partial sort: only the top of the list is ever shown or
+            # selected, so O(N log K) nsmallest beats a full sort
+            top_candidates = heapq.nsmallest(
+                max(self.config.max_feature_jobs, 10),
+                feature_candidates,
+                key=lambda x: x.total_score
+            )
+
             # Select top jobs
-            selected = feature_candidates[:self.config.max_feature_jobs]
+            selected = top_candidates[:self.config.max_feature_jobs]
             selected_jobs = [pj.job for pj in selected]
-            
-            # Display selection results
+
+            # Stash selection results for display_job_selection
             self.logger.info(f"Selected {len(selected_jobs)} feature jobs from {len(feature_candidates)} candidates")
-            
-            self._display_job_selection_table(feature_candidates, selected)
-            
+            self._last_job_selection = (top_candidates, selected)
+
             return selected_jobs
             
         except Exception as e:
@@ -163,13 +179,21 @@ class TaskProcessor:
             console.print(f"❌ Failed to get feature jobs: {e}", style="red")
             raise
     
+    def display_job_selection(self):
+        """Render the analysis table for the most recent job selection."""
+
+        if self._last_job_selection is not None:
+            self._display_job_selection_table(*self._last_job_selection)
+
     def _display_job_selection_table(
         self, 
         candidates: List[ProcessedJob], 
         selected: List[ProcessedJob]
     ):
         """Display job selection results in a formatted table."""
-        
+
+        from rich.table import Table
+
         table = Table(title="Job Selection Analysis")
         table.add_column("Job Title", style="cyan", max_width=30)
         table.add_column("Category", style="blue")
@@ -177,7 +201,10 @@ class TaskProcessor:
         table.add_column("Deadline", style="green")
         table.add_column("Score", style="red")
         table.add_column("Selected", style="bold")
-        
+
+        # Identity set keeps the per-row membership check O(1)
+        selected_ids = {id(pj) for pj in selected}
+
         for pj in candidates[:10]:  # Show top 10 candidates
             job = pj.job
             deadline_str = format_deadline_urgency(job.deadline)
@@ -193,7 +220,7 @@ class TaskProcessor:
             elif pj.category_priority == 4:
                 category = "Engineer"
             
-            selected_mark = "✅" if pj in selected else ""
+            selected_mark = "✅" if id(pj) in selected_ids else ""
             
             table.add_row(
                 clean_job_title(job.name),
@@ -213,14 +240,17 @@ class TaskProcessor:
         
         carryover_tasks = []
         excluded_count = 0
-        
+        # Categorize in the same pass; the display table and any later
+        # pattern analysis reuse these buckets instead of re-walking
+        categories = defaultdict(list)
+
         for task in tasks:
             # CRITICAL: Exclude Schedule category items (they don't carry over)
             if task.category == "Schedule":
                 excluded_count += 1
                 self.logger.debug(f"Excluding Schedule item: {task.name}")
                 continue
-            
+
             # Create new task with tomorrow's date
             carryover_task = Task(
                 id="",  # Will be assigned when created in Notion
@@ -230,17 +260,20 @@ class TaskProcessor:
                 priority_level=task.priority_level,
                 category=task.category
             )
-            
+
             carryover_tasks.append(carryover_task)
-        
+            categories[task.category or "Uncategorized"].append(carryover_task)
+
+        self._carryover_categories = dict(categories)
+
         # Log summary
         carried_over = len(carryover_tasks)
         console.print(f"✓ {carried_over} tasks prepared for carryover, {excluded_count} schedule items excluded", style="green")
-        
+
         if carryover_tasks:
             # Display carryover summary by category
-            categories = categorize_tasks_by_category(carryover_tasks)
-            
+            from rich.table import Table
+
             table = Table(title=f"Carryover Tasks - {format_date_for_display(new_date)}")
             table.add_column("Category", style="cyan")
             table.add_column("Tasks", style="yellow")
@@ -262,6 +295,20 @@ class TaskProcessor:
         
         return carryover_tasks
     
+    async def prefetch_database_schema(self) -> None:
+        """Warm the Plan AI schema while the user is reviewing.
+
+        Runs speculatively during the interactive review so the metadata
+        round-trip overlaps human think-time instead of delaying publication.
+        """
+
+        try:
+            await self.notion.get_database_schema(self.config.plan_ai_database_id)
+            self.logger.debug("Prefetched Plan AI database schema")
+        except Exception as e:
+            # Purely speculative - failures surface later on the real calls
+            self.logger.debug(f"Schema prefetch failed: {e}")
+
     async def create_database_entries(self, carryover_tasks: List[Task]) -> List[str]:
         """Create database entries for carryover tasks in Notion."""
         
@@ -270,65 +317,112 @@ class TaskProcessor:
             return []
         
         self.logger.info(f"Creating {len(carryover_tasks)} database entries")
-        created_ids = []
-        
+
+        # Build every payload up front so the gather below is pure I/O -
+        # property construction stays off the await path
+        payloads = [
+            create_task_properties(
+                name=t.name,
+                status=t.status,
+                next_reminder=t.next_reminder,
+                priority_level=t.priority_level,
+                category=t.category
+            )
+            for t in carryover_tasks
+        ]
+
+        # Dispatch all creations concurrently; the semaphore keeps the
+        # in-flight count at the API budget while the round-trips overlap
+        semaphore = asyncio.Semaphore(3)
+
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console
         ) as progress:
             task = progress.add_task("Creating database entries...", total=len(carryover_tasks))
-            
-            for carryover_task in carryover_tasks:
-                try:
-                    # Create properties for the task
-                    properties = create_task_properties(
-                        name=carryover_task.name,
-                        status=carryover_task.status,
-                        next_reminder=carryover_task.next_reminder,
-                        priority_level=carryover_task.priority_level,
-                        category=carryover_task.category
-                    )
-                    
-                    # Create in Notion
+
+            async def create_one(properties: Dict[str, Any]):
+                async with semaphore:
                     response = await self.notion.create_database_item(
                         self.config.plan_ai_database_id,
                         properties
                     )
-                    
-                    created_ids.append(response['id'])
                     progress.advance(task, 1)
-                    
-                except Exception as e:
-                    self.logger.error(f"Failed to create task '{carryover_task.name}': {e}")
-                    console.print(f"⚠️  Failed to create task: {carryover_task.name}", style="yellow")
-                    continue
-        
+                    return response['id']
+
+            results = await asyncio.gather(
+                *(create_one(p) for p in payloads),
+                return_exceptions=True
+            )
+
+        # Batch the failure report into one render instead of printing
+        # per task while the event loop is still dispatching requests
+        created_ids = []
+        failed_names = []
+        for carryover_task, result in zip(carryover_tasks, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Failed to create task '{carryover_task.name}': {result}")
+                failed_names.append(carryover_task.name)
+            else:
+                created_ids.append(result)
+
+        if failed_names:
+            console.print(
+                f"⚠️  Failed to create {len(failed_names)} task(s): {', '.join(failed_names)}",
+                style="yellow"
+            )
+
         console.print(f"✅ Created {len(created_ids)} database entries", style="green")
         return created_ids
     
-    def analyze_task_patterns(self, tasks: List[Task]) -> Dict[str, Any]:
-        """Analyze patterns in uncompleted tasks for insights."""
-        
+    def analyze_task_patterns(
+        self,
+        tasks: List[Task],
+        categories: Optional[Dict[str, List[Task]]] = None
+    ) -> Dict[str, Any]:
+        """Analyze patterns in uncompleted tasks for insights.
+
+        Pass precomputed category buckets (e.g. the ones cached by
+        create_carryover_tasks) to skip re-grouping the same tasks.
+        """
+
         if not tasks:
             return {"total": 0, "insights": []}
-        
-        categories = categorize_tasks_by_category(tasks)
-        priority_distribution = {}
-        
-        for task in tasks:
-            priority = task.priority_level or "No Priority"
-            priority_distribution[priority] = priority_distribution.get(priority, 0) + 1
-        
+
+        max_cat, max_count = None, 0
+
+        if categories is None:
+            # Single pass builds both distributions and tracks the largest
+            # bucket as it grows, so no rescan is needed afterwards
+            categories = defaultdict(list)
+            priority_distribution = Counter()
+
+            for task in tasks:
+                category = task.category or "Uncategorized"
+                bucket = categories[category]
+                bucket.append(task)
+                if len(bucket) > max_count:
+                    max_cat, max_count = category, len(bucket)
+                priority_distribution[task.priority_level or "No Priority"] += 1
+        else:
+            priority_distribution = Counter(
+                (task.priority_level or "No Priority") for task in tasks
+            )
+            for category, bucket in categories.items():
+                if len(bucket) > max_count:
+                    max_cat, max_count = category, len(bucket)
+
         insights = []
-        
+
         # Category insights
         if len(categories) > 3:
             insights.append(f"Tasks span {len(categories)} categories - consider focusing")
-        
-        max_category = max(categories.items(), key=lambda x: len(x[1]))
-        if len(max_category[1]) > len(tasks) * 0.4:
-            insights.append(f"Heavy focus on {max_category[0]} ({len(max_category[1])} tasks)")
+
+        if max_count > len(tasks) * 0.4:
+            insights.append(f"Heavy focus on {max_cat} ({max_count} tasks)")
         
         # Priority insights
         high_priority = priority_distribution.get("High", 0)
@@ -342,36 +436,26 @@ class TaskProcessor:
         return {
             "total": len(tasks),
             "categories": dict(categories),
-            "priorities": priority_distribution,
+            "priorities": dict(priority_distribution),
             "insights": insights
         }
 
     def get_task_summary_stats(self, tasks: List[Task]) -> Dict[str, int]:
         """Get summary statistics for tasks."""
         
-        stats = {
-            "total": len(tasks),
-            "high_priority": 0,
-            "medium_priority": 0,
-            "low_priority": 0,
-            "no_priority": 0,
-            "by_category": {}
-        }
-        
+        priorities = Counter()
+        by_category = Counter()
+
         for task in tasks:
-            # Count by priority
-            priority = task.priority_level or "No Priority"
-            if priority == "High":
-                stats["high_priority"] += 1
-            elif priority == "Medium":
-                stats["medium_priority"] += 1
-            elif priority == "Low":
-                stats["low_priority"] += 1
-            else:
-                stats["no_priority"] += 1
-            
-            # Count by category
-            category = task.category or "Uncategorized"
-            stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
-        
-        return stats
\ No newline at end of file
+            priorities[task.priority_level or "No Priority"] += 1
+            by_category[task.category or "Uncategorized"] += 1
+
+        known = priorities["High"] + priorities["Medium"] + priorities["Low"]
+        return {
+            "total": len(tasks),
+            "high_priority": priorities["High"],
+            "medium_priority": priorities["Medium"],
+            "low_priority": priorities["Low"],
+            "no_priority": len(tasks) - known,
+            "by_category": dict(by_category)
+        }
\ No newline at end of file
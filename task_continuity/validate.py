@@ -6,16 +6,30 @@ Tests configuration and system components without running the full workflow.
 
 import asyncio
 import sys
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from typing import Dict, Any, List
 
-from rich.console import Console  
 from rich.panel import Panel
-from rich.table import Table
+from rich.table import Column, Table
 from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
-console = Console()
+from utils import console
+
+# Column definitions are static across runs; declared once here and
+# handed to each Table as copies (Column instances carry a per-table
+# cell list, so they can't be attached to two tables directly)
+_CONFIG_COLUMNS = (
+    Column("Setting", style="cyan"),
+    Column("Value", style="yellow"),
+    Column("Status", style="green"),
+)
+
+_SUMMARY_COLUMNS = (
+    Column("Component", style="cyan"),
+    Column("Status", style="yellow"),
+    Column("Details", style="dim"),
+)
 
 async def test_configuration():
     """Test basic configuration loading."""
@@ -23,14 +37,11 @@ async def test_configuration():
     console.print("🔧 Testing Configuration...", style="blue")
     
     try:
-        from config import Config
-        config = Config()
+        from config import get_config
+        config = get_config()
         
         # Display configuration summary
-        table = Table(title="Configuration Summary")
-        table.add_column("Setting", style="cyan")
-        table.add_column("Value", style="yellow")
-        table.add_column("Status", style="green")
+        table = Table(*(col.copy() for col in _CONFIG_COLUMNS), title="Configuration Summary")
         
         table.add_row("API Key", f"{config.notion_api_key[:12]}...", "✅ Set" if config.notion_api_key else "❌ Missing")
         table.add_row("Plan AI DB", config.plan_ai_database_id[:16] + "...", "✅ Set")
@@ -52,8 +63,8 @@ async def test_notion_connection(config):
     console.print("\n🔗 Testing Notion Connection...", style="blue")
     
     try:
-        from notion_api import NotionClient
-        notion = NotionClient(config.notion_api_key)
+        from notion_api import get_notion_client
+        notion = get_notion_client(config.notion_api_key)
         
         # Test basic connection
         await notion.validate_connection()
@@ -65,58 +76,42 @@ async def test_notion_connection(config):
         console.print(f"❌ Notion connection failed: {e}", style="red")
         return None
 
+async def _probe_database(notion, database_id, label):
+    """Query one database and report its health."""
+
+    try:
+        items = await notion.get_database_items(database_id)
+        console.print(f"✅ {label} database: {len(items)} items", style="green")
+        return {
+            'success': True,
+            'count': len(items),
+            'sample_fields': list(items[0]['properties'].keys()) if items else []
+        }
+    except Exception as e:
+        console.print(f"❌ {label} database error: {e}", style="red")
+        return {'success': False, 'error': str(e)}
+
 async def test_database_access(notion, config):
     """Test access to both required databases."""
-    
+
     console.print("\n📊 Testing Database Access...", style="blue")
-    
-    results = {}
-    
-    # Test Plan AI database
-    try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-        ) as progress:
-            task = progress.add_task("Testing Plan AI database...", total=None)
-            
-            items = await notion.get_database_items(config.plan_ai_database_id)
-            results['plan_ai'] = {
-                'success': True,
-                'count': len(items),
-                'sample_fields': list(items[0]['properties'].keys()) if items else []
-            }
-            console.print(f"✅ Plan AI database: {len(items)} items", style="green")
-            
-    except Exception as e:
-        console.print(f"❌ Plan AI database error: {e}", style="red")
-        results['plan_ai'] = {'success': False, 'error': str(e)}
-    
-    # Test Job Tracker database
-    try:
-        with Progress(
-            SpinnerColumn(), 
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-            transient=True
-        ) as progress:
-            task = progress.add_task("Testing Job Tracker database...", total=None)
-            
-            items = await notion.get_database_items(config.job_tracker_database_id)
-            results['job_tracker'] = {
-                'success': True,
-                'count': len(items),
-                'sample_fields': list(items[0]['properties'].keys()) if items else []
-            }
-            console.print(f"✅ Job Tracker database: {len(items)} items", style="green")
-            
-    except Exception as e:
-        console.print(f"❌ Job Tracker database error: {e}", style="red")
-        results['job_tracker'] = {'success': False, 'error': str(e)}
-    
-    return results
+
+    # Both probes are independent reads, so issue them together under a
+    # single spinner instead of paying two sequential round-trips
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+        transient=True
+    ) as progress:
+        progress.add_task("Testing Plan AI and Job Tracker databases...", total=None)
+
+        plan_ai, job_tracker = await asyncio.gather(
+            _probe_database(notion, config.plan_ai_database_id, "Plan AI"),
+            _probe_database(notion, config.job_tracker_database_id, "Job Tracker"),
+        )
+
+    return {'plan_ai': plan_ai, 'job_tracker': job_tracker}
 
 async def test_task_processing(notion, config):
     """Test task processing components."""
@@ -138,7 +133,7 @@ async def test_task_processing(notion, config):
         
         # Test carryover logic (without creating actual entries)
         if uncompleted:
-            tomorrow = today.replace(day=today.day + 1)  # Simple tomorrow calc
+            tomorrow = today + timedelta(days=1)
             carryover = processor.create_carryover_tasks(uncompleted[:3], tomorrow)  # Test with first 3
             console.print(f"✅ Carryover logic: {len(carryover)} tasks processed", style="green")
         
@@ -188,10 +183,7 @@ def display_validation_summary(results: Dict[str, bool]):
     
     console.print("\n📋 Validation Summary", style="bold blue")
     
-    table = Table()
-    table.add_column("Component", style="cyan")
-    table.add_column("Status", style="yellow")
-    table.add_column("Details", style="dim")
+    table = Table(*(col.copy() for col in _SUMMARY_COLUMNS))
     
     status_emoji = {"config": "⚙️", "notion": "🔗", "databases": "📊", "processing": "⚡", "generation": "📝"}
     
@@ -238,19 +230,22 @@ async def main():
     results['notion'] = notion is not None
     
     if notion:
-        # Test database access
-        db_results = await test_database_access(notion, config)
+        # Database access, task processing and page generation don't
+        # depend on each other - only on the shared client, which is
+        # safe for concurrent use - so overlap them instead of waiting
+        # out three network-bound suites back to back
+        db_results, results['processing'], results['generation'] = await asyncio.gather(
+            test_database_access(notion, config),
+            test_task_processing(notion, config),
+            test_page_generation(config),
+        )
         results['databases'] = all(r.get('success', False) for r in db_results.values())
-        
-        # Test task processing
-        results['processing'] = await test_task_processing(notion, config)
     else:
         results['databases'] = False
         results['processing'] = False
-    
-    # Test page generation (independent of Notion)
-    results['generation'] = await test_page_generation(config)
-    
+        # Page generation needs no Notion access, so it still runs
+        results['generation'] = await test_page_generation(config)
+
     # Show summary
     display_validation_summary(results)
     